@@ -1,14 +1,18 @@
 """Internal utilities to manage the functions inside the package."""
 import functools
 import logging
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from maya import cmds
+from maya.api import OpenMaya
 
-__all__ = ["with_maya"]
+__all__ = ["NodeCache", "with_maya"]
 
 LOG = logging.getLogger(__name__)
 
+_NODE_CACHES = []  # type: List[NodeCache]
+_CALLBACKS = []  # type: List[int]
+
 
 def with_maya(minimum=None, maximum=None):
     # type: (Optional[int], Optional[int]) -> Callable[..., Any]
@@ -47,3 +51,98 @@ def with_maya(minimum=None, maximum=None):
         return wrapper
 
     return decorator
+
+
+class NodeCache(object):
+    """Associate the nodes of the current scene to other nodes.
+
+    The entries are keyed by the hash of an ``MObjectHandle`` and checked
+    against the node itself, so each node has its own entry, even the nodes
+    of a file referenced more than once, which share the same UUIDs. The
+    entries whose node or value has been deleted are dropped when they are
+    read.
+
+    All the caches are cleared when a scene is created or opened. The
+    callbacks doing it are registered on the first use, so the modules can
+    create their caches before maya is initialized.
+
+    Examples:
+        >>> from maya import cmds
+        >>> from maya.api import OpenMaya
+        >>> _ = cmds.file(new=True, force=True)
+        >>> sel = OpenMaya.MSelectionList()
+        >>> sel.add(cmds.createNode("transform", name="A"))
+        >>> sel.add(cmds.createNode("transform", name="B"))
+        >>> cache = NodeCache()
+        >>> cache.set(sel.getDependNode(0), sel.getDependNode(1))
+        >>> cache.get(sel.getDependNode(0)) == sel.getDependNode(1)
+        True
+        >>> cmds.delete("B")
+        >>> cache.get(sel.getDependNode(0)) is None
+        True
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self):
+        # type: () -> None
+        self._data = {}  # type: Dict[int, Tuple[Any, Any]]
+        _NODE_CACHES.append(self)
+
+    def get(self, node):
+        # type: (OpenMaya.MObject) -> Optional[OpenMaya.MObject]
+        """Get the node associated to the given node.
+
+        Arguments:
+            node: The node to look for.
+
+        Returns:
+            The associated node, or None if nothing valid is cached.
+        """
+        _register_callbacks()
+        code = OpenMaya.MObjectHandle(node).hashCode()
+        entry = self._data.get(code)
+        if entry is None:
+            return None
+        key, value = entry
+        if not key.isValid() or key.object() != node or not value.isValid():
+            del self._data[code]
+            return None
+        return value.object()
+
+    def set(self, node, value):
+        # type: (OpenMaya.MObject, OpenMaya.MObject) -> None
+        """Associate a node to the given node.
+
+        Arguments:
+            node: The node used as key.
+            value: The node to associate.
+        """
+        _register_callbacks()
+        key = OpenMaya.MObjectHandle(node)
+        self._data[key.hashCode()] = (key, OpenMaya.MObjectHandle(value))
+
+    def clear(self):
+        # type: () -> None
+        """Remove all the entries."""
+        self._data.clear()
+
+
+def _register_callbacks():
+    # type: () -> None
+    """Register the callbacks clearing the node caches if not already done."""
+    if _CALLBACKS:
+        return
+    for message in (
+        OpenMaya.MSceneMessage.kBeforeNew,
+        OpenMaya.MSceneMessage.kBeforeOpen,
+    ):
+        _CALLBACKS.append(
+            OpenMaya.MSceneMessage.addCallback(message, _clear_node_caches)
+        )
+
+
+def _clear_node_caches(*_):
+    # type: (Any) -> None
+    for cache in _NODE_CACHES:
+        cache.clear()
@@ -9,6 +9,7 @@ from typing import Any, Dict, Generator, List, Optional, Sequence, Union
 from maya import cmds, mel
 from maya.api import OpenMaya
 
+import maya_tools.api
 import maya_tools.io
 
 __all__ = [
@@ -189,57 +190,54 @@ def copy(source, destination, values=False, attributes=None, fatal=False):
     copied_attributes = []
     attributes = attributes or cmds.listAttr(source, userDefined=True) or []
 
+    src_fn = maya_tools.api.as_dg(source)
+    dst_fn = maya_tools.api.as_dg(destination)
+
+    # Gather the mel commands of all the attributes to evaluate them at once.
+    commands = []  # type: List[str]
     for attribute in attributes:
-        src_plug = "{}.{}".format(source, attribute)
-        dst_plug = "{}.{}".format(destination, attribute)
+        obj = src_fn.attribute(attribute)
 
         # `MFnCompoundAttribute.getAddAttrCmds` already handles the creation of
         # all the children of a compound attribute for us.
-        parent = cmds.attributeQuery(attribute, node=source, listParent=True)
-        if parent:
+        if not OpenMaya.MFnAttribute(obj).parent.isNull():
             continue
 
         # Check if the destination attribute does not already exists.
-        exists = cmds.objExists(dst_plug)
+        exists = dst_fn.hasAttribute(attribute)
         if exists and fatal:
+            dst_plug = "{}.{}".format(destination, attribute)
             msg = "The plug '{}' already exists.".format(dst_plug)
             raise AttributeError(msg)
 
-        # Get the MFnAttribute instance of the source plug.
-        sel = OpenMaya.MSelectionList()
-        sel.add(src_plug)
-        plug = sel.getPlug(0)
-
         # Create the attribute if it doesn't already exist.
         if not exists:
-            obj = plug.attribute()
-
-            # Get the mel command(s) needed to recreate the attribute(s).
-            commands = []
             if obj.hasFn(OpenMaya.MFn.kCompoundAttribute):
                 mfn = OpenMaya.MFnCompoundAttribute(obj)
-                commands.extend(mfn.getAddAttrCmds(longNames=True))
+                add_commands = mfn.getAddAttrCmds(longNames=True)
             else:
                 mfn = OpenMaya.MFnAttribute(obj)
-                commands.append(mfn.getAddAttrCmd(longFlags=True))
-
-            # Recreate the attribute in the destination node.
-            # NOTE: Remove the first indent (why Maya... xD) and the last ';'.
-            commands = ["{} {}".format(x[1:-1], destination) for x in commands]
-            cmd = ";".join(commands)
-            LOG.debug("Evaluate mel command: %s;", cmd)
-            mel.eval(cmd)
+                add_commands = [mfn.getAddAttrCmd(longFlags=True)]
+            commands.extend(add_commands)
 
             # Register the created attributes.
-            copied_attributes.extend(re.findall(r'-longName\s"(\w+)"', cmd))
+            for cmd in add_commands:
+                copied_attributes.extend(
+                    re.findall(r'-longName\s"(\w+)"', cmd)
+                )
 
         # Finally copy the current source value to the destination attribute.
         if values:
-            commands = plug.getSetAttrCmds(useLongNames=True)
-            commands = ["{} {}".format(x[1:-1], destination) for x in commands]
-            cmd = ";".join(commands)
-            LOG.debug("Evaluate mel command: %s;", cmd)
-            mel.eval(cmd)
+            plug = src_fn.findPlug(obj, False)
+            commands.extend(plug.getSetAttrCmds(useLongNames=True))
+
+    # Recreate the attributes and their values in the destination node.
+    # NOTE: Remove the first indent (why Maya... xD) and the last ';'.
+    if commands:
+        commands = ["{} {}".format(x[1:-1], destination) for x in commands]
+        cmd = ";".join(commands)
+        LOG.debug("Evaluate mel command: %s;", cmd)
+        mel.eval(cmd)
 
     return copied_attributes
 
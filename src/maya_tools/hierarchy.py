@@ -38,7 +38,21 @@ def make(path, node="transform"):
         The name of the leaf transform.
     """
     nodes = path.split("|")
-    for i, each in enumerate(nodes):
+
+    # Skip the part of the path that already exists, stopping at the first
+    # missing node so a new path only fails a single lookup.
+    sel = OpenMaya.MSelectionList()
+    start = 0
+    for depth in range(1, len(nodes) + 1):
+        try:
+            sel.add("|".join(nodes[:depth]))
+        except RuntimeError:
+            break
+        start = depth
+    if start == len(nodes):
+        return nodes[-1]
+
+    for i, each in enumerate(nodes[start:], start):
         if not cmds.objExists(each):
             cmds.createNode(node, name=each)
         parents = cmds.listRelatives(each, parent=True)
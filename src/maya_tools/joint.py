@@ -1,11 +1,16 @@
 """Joint utilities."""
 from __future__ import division
 
+import collections
 import logging
+from typing import Dict
 
 from maya import cmds
 from maya.api import OpenMaya
 
+import maya_tools.api
+import maya_tools.history
+
 __all__ = ["parent", "auto_radius"]
 
 LOG = logging.getLogger(__name__)
@@ -35,10 +40,14 @@ def parent(child, target):
         child (str): The name of the node to parent.
         parent (str): The node on which the child should be parented.
     """
-    mtx = cmds.xform(child, query=True, matrix=True, worldSpace=True)
-    cmds.parent(child, target, relative=True)
-    cmds.setAttr(child + ".jointOrient", 0, 0, 0)
-    cmds.xform(child, matrix=mtx, worldSpace=True)
+    mtx = maya_tools.api.as_path(child).inclusiveMatrix()
+
+    # Gather the commands in a single undo chunk, so the whole parenting can
+    # be reverted at once.
+    with maya_tools.history.undo():
+        child = cmds.parent(child, target, relative=True)[0]
+        cmds.setAttr(child + ".jointOrient", 0, 0, 0)
+        cmds.xform(child, matrix=list(mtx), worldSpace=True)
 
 
 def auto_radius(root, method="average", multiplier=1.0, recursive=False):
@@ -73,33 +82,41 @@ def auto_radius(root, method="average", multiplier=1.0, recursive=False):
         ValueError: The value passed to the parameter ``method`` is not valid.
     """
 
+    xform = cmds.xform
+    point = OpenMaya.MPoint
+    points = {}  # type: Dict[str, OpenMaya.MPoint]
+
     def get_point(node):
         # type: (str) -> OpenMaya.MPoint
-        pos = cmds.xform(node, query=True, translation=True, worldSpace=True)
-        return OpenMaya.MPoint(pos)
-
-    root_pos = get_point(root)
-
-    # Let's find and register the distance between the root and each of its
-    # children.
-    distances = []
-    for child in cmds.listRelatives(root, children=True, type="joint") or []:
-        distances.append(root_pos.distanceTo(get_point(child)))
-
-        # Make the recursion.
+        if node not in points:
+            pos = xform(node, query=True, translation=True, worldSpace=True)
+            points[node] = point(pos)
+        return points[node]
+
+    # Walk through the hierarchy iteratively instead of recursing for each
+    # child, so the position of each joint is only queried once.
+    queue = collections.deque([root])
+    while queue:
+        node = queue.popleft()
+        children = cmds.listRelatives(node, type="joint", fullPath=True) or []
         if recursive:
-            auto_radius(child, method, multiplier, recursive)
-
-    # If not valid children are found just set the radius to 1
-    if not distances:
-        value = 10.0
-    elif method == "average":
-        value = sum(distances) / len(distances)
-    elif method == "minimum":
-        value = min(distances)
-    elif method == "maximum":
-        value = max(distances)
-    else:
-        raise ValueError("Invalid method value.")
-
-    cmds.setAttr(root + ".radius", value * 0.1 * multiplier)
+            queue.extend(children)
+
+        # Let's find and register the distance between the joint and each of
+        # its children.
+        node_pos = get_point(node)
+        distances = [node_pos.distanceTo(get_point(x)) for x in children]
+
+        # If not valid children are found just set the radius to 1
+        if not distances:
+            value = 10.0
+        elif method == "average":
+            value = sum(distances) / len(distances)
+        elif method == "minimum":
+            value = min(distances)
+        elif method == "maximum":
+            value = max(distances)
+        else:
+            raise ValueError("Invalid method value.")
+
+        cmds.setAttr(node + ".radius", value * 0.1 * multiplier)
@@ -1,15 +1,22 @@
 """Mesh utilities."""
 import logging
 import operator
-from typing import Optional, Tuple, cast
+from typing import List, Optional, Sequence, Tuple, cast
 
 from maya import cmds
 from maya.api import OpenMaya
 
-__all__ = ["reset_vertices", "closest_vertex", "minimal_duplicate"]
+__all__ = [
+    "reset_vertices",
+    "closest_vertex",
+    "closest_vertices",
+    "minimal_duplicate",
+]
 
 LOG = logging.getLogger(__name__)
 
+Vector = Tuple[float, float, float]
+
 
 def reset_vertices(mesh):
     # type: (str) -> None
@@ -28,14 +35,16 @@ def reset_vertices(mesh):
     Arguments:
         mesh (str): The name of the mesh to reset.
     """
+    set_attr = cmds.setAttr
+    plug = mesh + ".pnts[{}].pnt{}"
     for i in range(cmds.polyEvaluate(mesh, vertex=True)):
-        cmds.setAttr("{}.pnts[{}].pntx".format(mesh, i), 0)
-        cmds.setAttr("{}.pnts[{}].pnty".format(mesh, i), 0)
-        cmds.setAttr("{}.pnts[{}].pntz".format(mesh, i), 0)
+        set_attr(plug.format(i, "x"), 0)
+        set_attr(plug.format(i, "y"), 0)
+        set_attr(plug.format(i, "z"), 0)
 
 
 def closest_vertex(mesh, origin):
-    # type: (str, Tuple[float, float, float]) -> Tuple[str, float]
+    # type: (str, Vector) -> Tuple[int, float]
     """Find the closest vertex to a given position.
 
     Examples:
@@ -60,17 +69,62 @@ def closest_vertex(mesh, origin):
     mfn = OpenMaya.MFnMesh(sel.getDagPath(0).extendToShape())
     point = OpenMaya.MPoint(origin)
 
-    # First find the closest face on the mesh
+    # A single query doesn't need to build an acceleration structure.
     face = mfn.getClosestPoint(point, space=space)[1]
+    return _closest_face_vertex(mfn, face, point)
+
+
+def closest_vertices(mesh, origins):
+    # type: (str, Sequence[Vector]) -> List[Tuple[int, float]]
+    """Find the closest vertex to each of the given positions.
+
+    This is the batch version of :func:`closest_vertex`. The mesh is resolved
+    only once and the closest faces are searched using an acceleration
+    structure shared by all the origins. Then the vertices of each face are
+    compared to find the closest one.
+
+    Examples:
+        >>> from maya import cmds
+        >>> _ = cmds.file(new=True, force=True)
+        >>> mesh = cmds.polyCube()[0]
+        >>> closest_vertices(mesh, [(0.5, 2, 0.5), (-0.5, -2, -0.5)])
+        [(3, 1.5), (6, 1.5)]
+
+    Arguments:
+        mesh: The name of the mesh on which the vertices will be searched.
+        origins: The x, y and z positions of the points to use as origins.
+
+    Returns:
+        The index of the closest vertex and its distance from the origin,
+        for each origin.
+    """
+    sel = OpenMaya.MSelectionList()
+    sel.add(mesh)
+    path = sel.getDagPath(0).extendToShape()
+
+    mfn = OpenMaya.MFnMesh(path)
+    intersector = OpenMaya.MMeshIntersector()
+    intersector.create(path.node(), path.inclusiveMatrix())
+
+    get_closest = intersector.getClosestPoint
 
-    # Then iterates through each vertex of the face to compare their distance
-    # with the origin point.
-    vertices = []
-    for vertex in mfn.getPolygonVertices(face):
-        distance = mfn.getPoint(vertex, space=space).distanceTo(point)
-        vertices.append((vertex, distance))
+    results = []
+    for origin in origins:
+        point = OpenMaya.MPoint(origin)
+        face = get_closest(point).face
+        results.append(_closest_face_vertex(mfn, face, point))
+    return results
 
-    # Finally return the vertex with the smallest distance
+
+def _closest_face_vertex(mfn, face, point):
+    # type: (OpenMaya.MFnMesh, int, OpenMaya.MPoint) -> Tuple[int, float]
+    """Find the vertex of the face that is the closest to the point."""
+    space = OpenMaya.MSpace.kWorld
+    get_point = mfn.getPoint
+    vertices = [
+        (x, get_point(x, space=space).distanceTo(point))
+        for x in mfn.getPolygonVertices(face)
+    ]
     return min(vertices, key=operator.itemgetter(1))
 
 
@@ -107,11 +161,8 @@ def minimal_duplicate(mesh, name=None):
     src = OpenMaya.MFnMesh(path)
     dst = OpenMaya.MFnMesh()
 
-    count = []
-    connect = []
-    for i in range(src.numPolygons):
-        count.append(src.polygonVertexCount(i))
-        connect.extend(src.getPolygonVertices(i))
+    # Query the whole topology at once instead of iterating over each polygon.
+    count, connect = src.getVertices()
 
     dag = OpenMaya.MDagModifier()
     obj = dag.createNode("transform")
@@ -1,4 +1,5 @@
 """Provide utilities related to names."""
+import fnmatch
 import logging
 import re
 from typing import List
@@ -9,6 +10,9 @@ __all__ = ["find_conflicts", "unique", "nice"]
 
 LOG = logging.getLogger(__name__)
 
+_UPPER_CASE = re.compile(r"(?<!^)([A-Z])")
+_SEPARATORS = re.compile(r"[_-]")
+
 
 def find_conflicts(create_set=False, set_name="CONFLICTS_NODES"):
     # type: (bool, str) -> List[str]
@@ -36,7 +40,9 @@ def find_conflicts(create_set=False, set_name="CONFLICTS_NODES"):
     Returns:
         The name of the conflicts nodes.
     """
-    nodes = [x for x in cmds.ls() if "|" in x]
+    # Only the dag nodes can share the same name, so there is no need to
+    # iterate over all the dependency nodes of the scene.
+    nodes = [x for x in cmds.ls(type="dagNode") if "|" in x]
     if create_set:
         if cmds.objExists(set_name):
             cmds.delete(set_name)
@@ -108,8 +114,20 @@ def unique(name):
         i = str(index).zfill(count)
         return name.replace("#" * count, i) if count else name
 
+    # Query all the names that can conflict at once instead of checking the
+    # existence of each generated name.
+    pattern = name.replace("#" * count, "*") if count else name + "*"
+    nodes = cmds.ls(pattern) or []
+    taken = set(nodes) | {x.rsplit("|", 1)[-1] for x in nodes}
+
+    def _exists(value):
+        # type: (str) -> bool
+        if "*" in value:
+            return any(fnmatch.fnmatchcase(x, value) for x in taken)
+        return value in taken
+
     generated = _build()
-    while cmds.objExists(generated):
+    while _exists(generated):
         if not count and not index:
             name += "#"
             count = 1
@@ -143,6 +161,4 @@ def nice(name):
     Returns:
         The generated nice name.
     """
-    return re.sub(
-        r"[_-]", r" ", re.sub(r"(?<!^)([A-Z])", r" \1", name)
-    ).title()
+    return _SEPARATORS.sub(" ", _UPPER_CASE.sub(r" \1", name)).title()
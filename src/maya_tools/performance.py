@@ -1,34 +1,95 @@
+# pylint: disable=import-outside-toplevel
 """Provide utilities to measure performance."""
-from __future__ import division
+from __future__ import division, print_function
 
 import contextlib
 import cProfile
+import functools
 import logging
+import multiprocessing
 import pstats
 import time
-from typing import Generator, Union
+import timeit
+from typing import Dict, Generator, Sequence, Union
 
-__all__ = ["profile", "timing"]
+from maya import cmds
+
+import maya_tools._internal
+
+__all__ = ["batch_fps", "fps", "profile", "timing"]
 
 LOG = logging.getLogger(__name__)
 
 
 @contextlib.contextmanager
-def profile(restrictions=10, sort="time", strip=False):
-    # type: (Union[int, float, str], str, bool) -> Generator[None, None, None]
+def profile(
+    restrictions=10,  # type: Union[int, float, str]
+    sort="time",  # type: str
+    strip=False,  # type: bool
+    backend="cProfile",  # type: str
+):  # type: (...) -> Generator[None, None, None]
     """Detail the execution of all statements in the block.
 
-    The following are the values accepted by the ``sort`` parameter:
+    The ``backend`` parameter defines the profiler used to measure the block.
+    The value can be either ``cProfile``, ``pyinstrument`` or ``yappi``.
+    ``pyinstrument`` is a sampling profiler, so its overhead doesn't grow with
+    the number of python calls and its results are closer to the real
+    behaviour inside maya. ``yappi`` is a tracing profiler like ``cProfile``,
+    but measures the wall clock time of all the threads. These two last ones
+    need to be installed separately.
+
+    The ``restrictions``, ``sort`` and ``strip`` parameters are only used by
+    the ``cProfile`` backend.
+
+    The values accepted by the ``sort`` parameter are the ones of
+    ``pstats.Stats.sort_stats``, such as ``time``, ``cumulative``, ``calls``
+    or ``name``.
 
     Arguments:
         restrictions: Limit the list down to the significant entries.
         sort: Sorts the output according to the specified mode.
         strip: Removes all leading path information from file name.
+        backend: The profiler to use to measure the block.
+
+    Raises:
+        ValueError: The specified backend is not recognized.
     """
+    if backend == "pyinstrument":
+        from pyinstrument import Profiler
+
+        sampler = Profiler()
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            print(sampler.output_text(unicode=True, color=True))
+        return
+
+    if backend == "yappi":
+        import yappi
+
+        # yappi is global to the process, make sure it never keeps running
+        # after the block.
+        yappi.set_clock_type("wall")
+        yappi.start()
+        try:
+            yield
+        finally:
+            yappi.stop()
+            yappi.get_func_stats().print_all()
+            yappi.clear_stats()
+        return
+
+    if backend != "cProfile":
+        raise ValueError("The backend '{}' is not valid.".format(backend))
+
     profiler = cProfile.Profile()
     profiler.enable()
-    yield
-    profiler.disable()
+    try:
+        yield
+    finally:
+        profiler.disable()
 
     stats = pstats.Stats(profiler)
     if strip:
@@ -72,3 +133,108 @@ def timing(name, unit="millisecond", message="{name}: {time:.3f} {unit}"):
     }
     exec_time = (end - start) * multiplier[unit]
     LOG.info(message.format(name=name, time=exec_time, unit=unit))
+
+
+@maya_tools._internal.with_maya(minimum=2019)
+def fps(loops=1, cache=False):
+    # type: (int, bool) -> float
+    """Measure the playback speed of the current scene.
+
+    Each frame of the playback range is evaluated one after the other, and
+    the whole range is evaluated ``loops`` times. Going back to the first
+    frame between each loop is done while the refresh is suspended to avoid
+    a useless redraw of the viewport.
+
+    Using ``cache=True``, the cached playback evaluator will be enabled during
+    the execution. Its previous state is restored at the end.
+
+    Arguments:
+        loops: The number of times the playback range is evaluated.
+        cache: Enable the cached playback evaluator.
+
+    Returns:
+        The average number of frames evaluated per second.
+
+    Raises:
+        ValueError: The number of loops is lower than one.
+    """
+    if loops < 1:
+        raise ValueError("The number of loops must be at least one.")
+
+    start_frame = cmds.playbackOptions(query=True, minTime=True)
+    end_frame = cmds.playbackOptions(query=True, maxTime=True)
+    frames = range(int(start_frame), int(end_frame) + 1)
+
+    state = cmds.evaluator(name="cache", query=True, enable=True)
+    cmds.evaluator(name="cache", enable=cache)
+    try:
+        elapsed = 0.0
+        for _ in range(loops):
+            cmds.refresh(suspend=True)
+            cmds.currentTime(start_frame)
+            cmds.refresh(suspend=False)
+
+            start = timeit.default_timer()
+            for frame in frames:
+                cmds.currentTime(frame)
+            elapsed += timeit.default_timer() - start
+    finally:
+        cmds.evaluator(name="cache", enable=state)
+
+    result = len(frames) * loops / elapsed
+    LOG.info("Playback speed: %.3f fps", result)
+    return result
+
+
+def batch_fps(paths, processes=4, loops=1, cache=False):
+    # type: (Sequence[str], int, int, bool) -> Dict[str, float]
+    """Measure the playback speed of multiple scenes in parallel.
+
+    Each scene is opened in its own maya standalone process and measured
+    with the :func:`fps` function. Each process is initialized once and then
+    reused for the next scenes.
+
+    Note:
+        This function is intended to be called from ``mayapy``, as the child
+        processes are started with the current python executable.
+
+    Arguments:
+        paths: The path of the scenes to measure.
+        processes: The number of processes running at the same time.
+        loops: The number of times the playback range is evaluated.
+        cache: Enable the cached playback evaluator.
+
+    Returns:
+        The average number of frames evaluated per second of each scene.
+
+    Raises:
+        RuntimeError: The processes cannot be spawned with Python 2.
+    """
+    # Start fresh interpreters rather than forking the current maya session,
+    # which is not safe once maya is initialized.
+    try:
+        context = multiprocessing.get_context("spawn")
+    except AttributeError:
+        raise RuntimeError("Python 2 cannot spawn the standalone processes.")
+
+    func = functools.partial(_scene_fps, loops=loops, cache=cache)
+    pool = context.Pool(processes, initializer=_initialize_standalone)
+    try:
+        results = pool.map(func, paths)
+    finally:
+        pool.close()
+        pool.join()
+    return dict(zip(paths, results))
+
+
+def _initialize_standalone():
+    # type: () -> None
+    from maya import standalone
+
+    standalone.initialize()
+
+
+def _scene_fps(path, loops=1, cache=False):
+    # type: (str, int, bool) -> float
+    cmds.file(path, open=True, force=True)
+    return float(fps(loops=loops, cache=cache))
@@ -5,6 +5,7 @@ import logging
 from typing import List
 
 from maya import cmds
+from maya.api import OpenMaya
 
 import maya_tools.api
 
@@ -31,16 +32,12 @@ def distribute(nodes):
     Arguments:
         nodes: The nodes to move.
     """
-    first = maya_tools.api.get_point(nodes[0])
-    last = maya_tools.api.get_point(nodes[-1])
-
+    first = OpenMaya.MVector(maya_tools.api.get_point(nodes[0]))
+    last = OpenMaya.MVector(maya_tools.api.get_point(nodes[-1]))
     offset = (last - first) * (1 / (len(nodes) - 1))
 
-    previous = first
-    for node in nodes[1:-1]:
-        cmds.xform(
-            node,
-            translation=previous + offset,
-            worldSpace=True,
-        )
-        previous += offset
+    # Compute each position from the first one instead of accumulating the
+    # offset, and keep `cmds.xform` so the distribution can be undone.
+    xform = cmds.xform
+    for i, node in enumerate(nodes[1:-1], 1):
+        xform(node, translation=list(first + offset * i), worldSpace=True)
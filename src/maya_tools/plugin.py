@@ -1,19 +1,28 @@
 """Provide utilities related to plugins."""
 import logging
+from typing import Any, List, Set
 
 from maya import cmds
+from maya.api import OpenMaya
 
 __all__ = ["remove_unknown", "reload", "load", "unload"]
 
 LOG = logging.getLogger(__name__)
 
+_LOADED = set()  # type: Set[str]
+_CALLBACKS = []  # type: List[int]
+
 
 def remove_unknown():
     # type: () -> None
     """Remove the unused plugin present in the current scene."""
-    for plugin in cmds.unknownPlugin(query=True, list=True) or []:
-        cmds.unknownPlugin(plugin, remove=True)
-        LOG.info("Unloading unknown plugin: '%s'", plugin)
+    plugins = cmds.unknownPlugin(query=True, list=True) or []
+    if not plugins:
+        return
+    remove = cmds.unknownPlugin
+    for plugin in plugins:
+        remove(plugin, remove=True)
+    LOG.info("Unloading %d unknown plugins: %s", len(plugins), plugins)
 
 
 def reload(name):
@@ -37,6 +46,8 @@ def load(name):
     Argguments:
         name: The name of the plugin that should be loaded.
     """
+    if name in _loaded():
+        return
     if not cmds.pluginInfo(name, query=True, loaded=True):
         cmds.loadPlugin(name)
 
@@ -51,6 +62,39 @@ def unload(name):
     Argguments:
         name: The name of the plugin that should be unloaded.
     """
-    if cmds.pluginInfo(name, query=True, loaded=True):
+    if name in _loaded() or cmds.pluginInfo(name, query=True, loaded=True):
         cmds.flushUndo()
         cmds.unloadPlugin(name)
+
+
+def _loaded():
+    # type: () -> Set[str]
+    """Get the name of the loaded plugins without querying maya.
+
+    The set is filled on the first call, then kept up to date by callbacks.
+    Plugins referenced by a path or a file name are not part of it.
+    """
+    if not _CALLBACKS:
+        _LOADED.update(cmds.pluginInfo(query=True, listPlugins=True) or [])
+        message = OpenMaya.MSceneMessage
+        _CALLBACKS.append(
+            message.addStringArrayCallback(message.kAfterPluginLoad, _on_load)
+        )
+        _CALLBACKS.append(
+            message.addStringArrayCallback(
+                message.kAfterPluginUnload, _on_unload
+            )
+        )
+    return _LOADED
+
+
+def _on_load(data, *_):
+    # type: (List[str], Any) -> None
+    # The data contains the path and then the name of the plugin.
+    _LOADED.add(data[1])
+
+
+def _on_unload(data, *_):
+    # type: (List[str], Any) -> None
+    # The data contains the name and then the path of the plugin.
+    _LOADED.discard(data[0])
@@ -1,8 +1,7 @@
 """Common utilities to search nodes in the current scene."""
-import itertools
 import logging
 import re
-from typing import Generator, Optional, Sequence
+from typing import Dict, Generator, Optional, Pattern, Sequence
 
 from maya import cmds
 
@@ -10,6 +9,12 @@ LOG = logging.getLogger(__name__)
 
 __all__ = ["regex", "mirror"]
 
+_PATTERNS = {}  # type: Dict[str, Pattern[str]]
+_PATTERNS_SIZE = 256
+
+_FLAGS = re.compile(r"\(\?[aiLmsux]")
+_SUFFIX = re.compile(r"(\\?)([A-Za-z0-9_]+)$")
+
 
 def regex(expression):
     # type: (str) -> Generator[str, None, None]
@@ -27,10 +32,11 @@ def regex(expression):
     Yield:
         str: The name of the node that match the expression.
     """
-    regex_ = re.compile(expression)
-    for each in cmds.ls():
-        if regex_.match(each):
-            yield each
+    regex_ = _compile(expression)
+    glob = _glob(expression)
+    nodes = cmds.ls(glob, recursive=True) if glob else cmds.ls()
+    for each in filter(regex_.match, nodes):
+        yield each
 
 
 def mirror(node, patterns=("L_:R_", "l_:r_")):
@@ -62,12 +68,43 @@ def mirror(node, patterns=("L_:R_", "l_:r_")):
         The name of the opposite node or None in the case where nothing as
         been found.
     """
+    exists = cmds.objExists
     for pattern in patterns:
         right, left = pattern.split(":")
-        for current, opposite in itertools.permutations((left, right)):
-            if current not in node:
-                continue
-
-            opposite_node = node.replace(current, opposite)
-            return opposite_node if cmds.objExists(opposite_node) else None
+        for current, opposite in ((left, right), (right, left)):
+            if current in node:
+                opposite_node = node.replace(current, opposite)
+                return opposite_node if exists(opposite_node) else None
     return None
+
+
+def _compile(expression):
+    # type: (str) -> Pattern[str]
+    """Compile the given expression, reusing the previously compiled ones."""
+    try:
+        return _PATTERNS[expression]
+    except KeyError:
+        if len(_PATTERNS) >= _PATTERNS_SIZE:
+            _PATTERNS.clear()
+        pattern = _PATTERNS[expression] = re.compile(expression)
+        return pattern
+
+
+def _glob(expression):
+    # type: (str) -> Optional[str]
+    """Build a maya pattern matching a superset of the given expression.
+
+    Only the literal suffix of an expression anchored with ``$`` can be used,
+    as the names returned by ``cmds.ls()`` may start with a namespace or a
+    parent path that a maya pattern would not match. No pattern is built when
+    the suffix follows a backslash, as it may be part of an escape sequence
+    such as ``\\x41``.
+    """
+    if "|" in expression or _FLAGS.search(expression):
+        return None
+    if not expression.endswith("$") or expression.endswith("\\$"):
+        return None
+    match = _SUFFIX.search(expression[:-1])
+    if not match or match.group(1):
+        return None
+    return "*" + match.group(2)
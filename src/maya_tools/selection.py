@@ -1,7 +1,6 @@
 """Utilities related to selection."""
-import contextlib
 import logging
-from typing import Generator, List
+from typing import Any, List
 
 from maya import cmds
 from maya.api import OpenMaya, OpenMayaUI
@@ -27,9 +26,7 @@ def from_viewport():  # pragma: no cover
     )
 
 
-@contextlib.contextmanager
-def keep():
-    # type: () -> Generator[List[str], None, None]
+class _KeepSelection(object):
     """Preserve the selection during the execution.
 
     This will store the current selection, execute the given block and then
@@ -47,13 +44,28 @@ def keep():
         ['A']
 
     Yields:
-        The name of the current selected nodes.:w
+        The name of the current selected nodes.
     """
-    selection = cmds.ls(selection=True)
-    try:
-        yield selection
-    finally:
-        if selection:
-            cmds.select(selection)
+
+    # Implemented as a class rather than with `contextlib.contextmanager` to
+    # avoid the generator overhead on each use.
+    __slots__ = ("selection",)
+
+    def __init__(self):
+        # type: () -> None
+        self.selection = []  # type: List[str]
+
+    def __enter__(self):
+        # type: () -> List[str]
+        self.selection = cmds.ls(selection=True)
+        return self.selection
+
+    def __exit__(self, *_):
+        # type: (Any) -> None
+        if self.selection:
+            cmds.select(self.selection)
         else:
             cmds.select(clear=True)
+
+
+keep = _KeepSelection  # pylint: disable=invalid-name
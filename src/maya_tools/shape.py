@@ -4,7 +4,7 @@ from typing import Optional, cast
 
 from maya import cmds
 
-__all__ = ["get_orig", "clean_orig"]
+__all__ = ["get_orig", "get_orig_plug", "clean_orig"]
 
 LOG = logging.getLogger(__name__)
 
@@ -32,10 +32,34 @@ def get_orig(shape):
     Returns:
         str: The name of the associated orig shape.
     """
+    return get_orig_plug(shape).partition(".")[0]
+
+
+def get_orig_plug(shape):
+    # type: (str) -> str
+    """Return the output plug of the orig shape associated to the given shape.
+
+    Like :func:`get_orig`, an orig shape is created if the given shape doesn't
+    have any.
+
+    Examples:
+        >>> from maya import cmds
+        >>> _ = cmds.file(new=True, force=True)
+        >>> geo = cmds.polySphere(constructionHistory=False)[0]
+        >>> shape = cmds.listRelatives(geo, shapes=True)[0]
+        >>> get_orig_plug(shape)
+        'pSphereShape1Orig.worldMesh'
+
+    Arguments:
+        shape (str): The name source shape.
+
+    Returns:
+        str: The name of the output plug of the associated orig shape.
+    """
     orig = cmds.deformableShape(shape, originalGeometry=True)[0]
     if not orig:
         orig = cmds.deformableShape(shape, createOriginalGeometry=True)[0]
-    return cast(str, orig.split(".")[0])
+    return cast(str, orig)
 
 
 def clean_orig(node=None):
@@ -58,7 +82,18 @@ def clean_orig(node=None):
         node (str, optional): The name of the node that need to be cleaned.
     """
     args = [node] if node else []
-    shapes = cmds.ls(*args, intermediateObjects=True, dagObjects=True)
-    for shape in shapes or []:
-        if not cmds.listConnections(shape, type="groupParts"):
-            cmds.delete(shape)
+    flags = {"intermediateObjects": True, "dagObjects": True, "long": True}
+    shapes = cmds.ls(*args, **flags)
+    if not shapes:
+        return
+
+    # Query the connections of all the shapes at once. The returned list
+    # contains pairs of plugs on the shapes with their connected node.
+    pairs = cmds.listConnections(shapes, type="groupParts", connections=True)
+    nodes = [x.split(".")[0] for x in (pairs or [])[::2]]
+    connected = set(cmds.ls(nodes, long=True)) if nodes else set()
+
+    # Delete everything in one command to only have a single undo step.
+    to_delete = [x for x in shapes if x not in connected]
+    if to_delete:
+        cmds.delete(to_delete)
@@ -3,6 +3,10 @@ import logging
 from typing import List, cast
 
 from maya import cmds, mel
+from maya.api import OpenMaya, OpenMayaAnim
+
+import maya_tools._internal
+import maya_tools.api
 
 __all__ = [
     "create",
@@ -14,6 +18,8 @@ __all__ = [
 
 LOG = logging.getLogger(__name__)
 
+_CACHE = maya_tools._internal.NodeCache()
+
 
 def create(node, influences, method="blend"):
     # type: (str, List[str], str) -> str
@@ -50,7 +56,7 @@ def create(node, influences, method="blend"):
     except KeyError:
         raise ValueError("The method '{}' is not valid.".format(method))
 
-    skincluster = mel.eval("findRelatedSkinCluster {}".format(node))
+    skincluster = _find_related(node)
     if not skincluster:
         skincluster = cmds.skinCluster(
             node,
@@ -60,12 +66,17 @@ def create(node, influences, method="blend"):
             toSelectedBones=True,
             removeUnusedInfluence=False,
         )[0]
+        _CACHE.set(
+            maya_tools.api.as_object(node),
+            maya_tools.api.as_object(skincluster),
+        )
     else:
         current = cmds.skinCluster(skincluster, query=True, influence=True)
-        delta = set(influences) - set(current)
+        current_set = set(current)
+        delta = [x for x in influences if x not in current_set]
         cmds.skinCluster(skincluster, edit=True, addInfluence=delta)
 
-    return cast(str, skincluster)
+    return skincluster
 
 
 def find_influences(node, weighted=True, unused=True):
@@ -102,7 +113,7 @@ def find_influences(node, weighted=True, unused=True):
     Returns:
         An array containing the influence objects.
     """
-    skc = mel.eval("findRelatedSkinCluster {}".format(node))
+    skc = _find_related(node)
     all_ = cast(List[str], cmds.skinCluster(skc, query=True, influence=True))
     if unused and weighted:
         return all_
@@ -112,7 +123,8 @@ def find_influences(node, weighted=True, unused=True):
     )
     if weighted:
         return weighted_
-    return list(set(all_) - set(weighted_))
+    weighted_set = set(weighted_)
+    return [x for x in all_ if x not in weighted_set]
 
 
 def add_influences(node, influences):
@@ -140,12 +152,13 @@ def add_influences(node, influences):
         node: The deformed node on which the skincluster is attached.
         influences: The influences nodes to add to the skincluster.
     """
-    skincluster = mel.eval("findRelatedSkinCluster {}".format(node))
+    skincluster = _find_related(node)
     if not skincluster:
         LOG.error("No skincluster found under the node '%s'.", node)
         return
     current = cmds.skinCluster(skincluster, query=True, influence=True)
-    delta = set(influences) - set(current)
+    current_set = set(current)
+    delta = [x for x in influences if x not in current_set]
     cmds.skinCluster(skincluster, edit=True, addInfluence=delta)
 
 
@@ -177,12 +190,13 @@ def remove_influences(node, influences):
     Raises:
         RuntimeError: No skincluster attached on the node.
     """
-    skincluster = mel.eval("findRelatedSkinCluster {}".format(node))
+    skincluster = _find_related(node)
     if not skincluster:
         msg = "No skincluster found under the node '{}'."
         raise RuntimeError(msg.format(node))
-    inf = set(influences) & set(find_influences(node))
-    cmds.skinCluster(skincluster, edit=True, removeInfluence=list(inf))
+    wanted = set(influences)
+    inf = [x for x in find_influences(node) if x in wanted]
+    cmds.skinCluster(skincluster, edit=True, removeInfluence=inf)
 
 
 def remove_unused_influences(node):
@@ -209,3 +223,32 @@ def remove_unused_influences(node):
         node: The deformed node on which the skincluster is attached.
     """
     remove_influences(node, find_influences(node, weighted=False, unused=True))
+
+
+def _find_related(node):
+    # type: (str) -> str
+    """Find the skincluster attached to the node, reusing previous lookups.
+
+    Only the found skinclusters are cached, and a cached skincluster that no
+    longer deforms the node is searched again.
+    """
+    obj = maya_tools.api.as_object(node)
+    cached = _CACHE.get(obj)
+    if cached is not None and _deforms(cached, obj):
+        return cast(str, OpenMaya.MFnDependencyNode(cached).name())
+
+    skincluster = cast(str, mel.eval("findRelatedSkinCluster " + node))
+    if skincluster:
+        _CACHE.set(obj, maya_tools.api.as_object(skincluster))
+    return skincluster
+
+
+def _deforms(deformer, node):
+    # type: (OpenMaya.MObject, OpenMaya.MObject) -> bool
+    """Check if the deformer deforms the node or one of its shapes."""
+    candidates = [node]
+    if node.hasFn(OpenMaya.MFn.kTransform):
+        mfn = OpenMaya.MFnDagNode(node)
+        candidates.extend(mfn.child(i) for i in range(mfn.childCount()))
+    outputs = OpenMayaAnim.MFnGeometryFilter(deformer).getOutputGeometry()
+    return any(x == y for x in outputs for y in candidates)
@@ -2,12 +2,15 @@
 import logging
 from typing import Optional
 
+import shiboken2
 from PySide2 import QtWidgets
 
 from maya import cmds
 
 LOG = logging.getLogger(__name__)
 
+_MAIN_WINDOW = None  # type: Optional[QtWidgets.QWidget]
+
 
 def main_window():  # pragma: no cover
     # type: () -> Optional[QtWidgets.QWidget]
@@ -16,14 +19,21 @@ def main_window():  # pragma: no cover
     When launch in standalone mode, maya does not have any qt application, so
     this function will not return anything.
 
+    The widget is cached after the first call and only searched again if the
+    underlying C++ object has been deleted.
+
     Arguments:
         name: The widget name to search.
 
     Returns:
         The top level widget or None of maya is in standalone mode.
     """
-    top = QtWidgets.QApplication.topLevelWidgets()
-    return ([w for w in top if w.objectName() == "MayaWindow"] or [None])[0]
+    global _MAIN_WINDOW  # pylint: disable=global-statement
+    if _MAIN_WINDOW is None or not shiboken2.isValid(_MAIN_WINDOW):
+        top = QtWidgets.QApplication.topLevelWidgets()
+        widgets = (w for w in top if w.objectName() == "MayaWindow")
+        _MAIN_WINDOW = next(widgets, None)
+    return _MAIN_WINDOW
 
 
 def toggle_panel_element(element, panel=None):
@@ -53,5 +63,6 @@ def toggle_panel_element(element, panel=None):
     """
     if panel is None:
         panel = cmds.getPanel(withFocus=True)
-    state = cmds.modelEditor(panel, query=True, **{element: True})
-    cmds.modelEditor(panel, edit=True, **{element: not state})
+    flags = {element: True}
+    flags[element] = not cmds.modelEditor(panel, query=True, **flags)
+    cmds.modelEditor(panel, edit=True, **flags)
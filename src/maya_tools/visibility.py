@@ -1,7 +1,7 @@
 """Visibility modules."""
 import logging
 
-from maya import cmds
+from maya.api import OpenMaya
 
 __all__ = ["is_visible"]
 
@@ -36,10 +36,37 @@ def is_visible(node):
     Returns:
         True if the node is visible, False otherwise.
     """
-    path = cmds.ls(node, long=True)[0]
-    while "|" in path:
-        path, tail = path.rsplit("|", 1)
-        visible = cmds.getAttr(tail + ".visibility")
-        if not visible:
+    sel = OpenMaya.MSelectionList()
+    try:
+        sel.add(node)
+    except RuntimeError:
+        raise IndexError("The node '{}' does not exist.".format(node))
+
+    # The nodes outside of the dag don't have any visibility.
+    if not sel.getDependNode(0).hasFn(OpenMaya.MFn.kDagNode):
+        return True
+    return _is_visible_path(sel.getDagPath(0))
+
+
+def _is_visible_path(path):
+    # type: (OpenMaya.MDagPath) -> bool
+    """Check the visibility of an already resolved dag path.
+
+    Batch callers can resolve their paths once and skip the name lookup done
+    by :func:`is_visible`. The given path is not modified.
+    """
+    path = OpenMaya.MDagPath(path)
+
+    # All the dag nodes share the same visibility attribute, so it can be
+    # resolved once and reused to find the plug of each ancestor.
+    mfn = OpenMaya.MFnDependencyNode(path.node())
+    attribute = mfn.attribute("visibility")
+
+    # Walk up the dag path and read the visibility plugs directly instead of
+    # querying each ancestor by name.
+    while path.length():
+        mfn.setObject(path.node())
+        if not mfn.findPlug(attribute, False).asBool():
             return False
+        path.pop()
     return True
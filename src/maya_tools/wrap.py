@@ -3,6 +3,8 @@ import logging
 
 from maya import cmds
 
+import maya_tools.shape
+
 __all__ = ["proximity"]
 
 LOG = logging.getLogger(__name__)
@@ -30,9 +32,7 @@ def proximity(driver, driven, falloff=1.0):
     """
     deformer = cmds.deformer(driven, type="proximityWrap")[0]  # type: str
     plug = deformer + ".drivers[0]"
-    orig = cmds.deformableShape(driver, originalGeometry=True)[0]
-    if not orig:
-        orig = cmds.deformableShape(driver, createOriginalGeometry=True)[0]
+    orig = maya_tools.shape.get_orig_plug(driver)
     cmds.connectAttr(orig, plug + ".driverBindGeometry")
     cmds.connectAttr(driver + ".worldMesh", plug + ".driverGeometry")
     cmds.setAttr(deformer + ".falloffScale", falloff)
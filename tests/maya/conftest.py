@@ -0,0 +1,135 @@
+# pylint: disable=redefined-outer-name, unused-argument
+"""Configure pytest environement for the tests that use the scene."""
+from typing import Any, Callable, Generator, List
+
+import pytest
+
+from maya import cmds
+from maya.api import OpenMaya
+
+# The transform pools alive, recreated when the scene is reset.
+_POOLS = []  # type: List[List[str]]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def empty_scene():
+    # type: () -> None
+    """Start the test session from an empty scene."""
+    cmds.file(new=True, force=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def no_undo():
+    # type: () -> Generator[None, None, None]
+    """Disable the undo queue, which is never used by the tests."""
+    state = cmds.undoInfo(query=True, state=True)
+    cmds.undoInfo(state=False)
+    yield
+    cmds.undoInfo(state=state)
+
+
+@pytest.fixture
+def undo(no_undo):
+    # type: (None) -> Generator[None, None, None]
+    """Enable the undo queue for the tests that rely on it."""
+    cmds.undoInfo(state=True)
+    yield
+    cmds.undoInfo(state=False)
+
+
+@pytest.fixture(autouse=True)
+def new_scene(request, empty_scene):
+    # type: (Any, None) -> Generator[None, None, None]
+    """Delete the nodes created by the test.
+
+    Deleting only the nodes that did not exist before the test is much faster
+    than creating a new scene each time. A new scene is still created if the
+    created nodes cannot be deleted, or if the test requests :func:`new_file`.
+    """
+    before = set(cmds.ls(long=True))
+    yield
+    if "new_file" in request.fixturenames:
+        _reset_scene()
+    else:
+        created = [x for x in cmds.ls(long=True) if x not in before]
+        if created:
+            try:
+                cmds.delete(created)
+            except (RuntimeError, ValueError):
+                _reset_scene()
+    cmds.flushUndo()
+
+
+@pytest.fixture
+def new_file():
+    # type: () -> None
+    """Create a new scene after the test instead of deleting its nodes.
+
+    The tests changing the state of the scene, such as the playback range,
+    the current time or the scene name, must request this fixture, as
+    deleting their nodes doesn't restore it. The scene is created by
+    :func:`new_scene`.
+    """
+
+
+@pytest.fixture(scope="module")
+def transform_pool(empty_scene):
+    # type: (None) -> Generator[List[str], None, None]
+    """Create a pool of transforms shared by all the tests of a module.
+
+    The pool is filled again with new transforms if the scene is reset by
+    :func:`new_scene`.
+    """
+    nodes = _create_transforms(10)
+    _POOLS.append(nodes)
+    yield nodes
+    _POOLS.remove(nodes)
+    cmds.delete([x for x in nodes if cmds.objExists(x)])
+
+
+@pytest.fixture
+def clear_attributes():
+    # type: () -> Callable[[str], None]
+    """Get the function deleting all the user-defined attributes of a node."""
+    return _clear_attributes
+
+
+@pytest.fixture
+def transforms(request, transform_pool):
+    # type: (Any, List[str]) -> Generator[List[str], None, None]
+    """Lend transforms from the pool and remove their user attributes after.
+
+    The number of transforms defaults to two and can be changed by indirect
+    parametrization.
+    """
+    nodes = transform_pool[: getattr(request, "param", 2)]
+    yield nodes
+    for node in nodes:
+        if cmds.objExists(node):
+            _clear_attributes(node)
+
+
+def _reset_scene():
+    # type: () -> None
+    """Create a new scene and fill the transform pools again."""
+    cmds.file(new=True, force=True)
+    for pool in _POOLS:
+        pool[:] = _create_transforms(len(pool))
+
+
+def _create_transforms(count):
+    # type: (int) -> List[str]
+    """Create the given number of transforms with a single modifier."""
+    dag = OpenMaya.MDagModifier()
+    objects = [dag.createNode("transform") for _ in range(count)]
+    dag.doIt()
+    return [OpenMaya.MFnDagNode(x).fullPathName() for x in objects]
+
+
+def _clear_attributes(node):
+    # type: (str) -> None
+    """Delete the user-defined attributes, children included, of the node."""
+    for attribute in cmds.listAttr(node, userDefined=True) or []:
+        plug = "{}.{}".format(node, attribute)
+        if cmds.objExists(plug):
+            cmds.deleteAttr(plug)
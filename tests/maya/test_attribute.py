@@ -0,0 +1,224 @@
+"""Test for attribute."""
+import collections
+import contextlib
+from typing import Any, Callable, Dict, Generator, List, Tuple
+
+import pytest
+
+from maya import cmds
+from maya.api import OpenMaya
+
+import maya_tools.api
+import maya_tools.attribute
+import maya_tools.history
+
+NUMERIC_TYPES = {
+    "bool": OpenMaya.MFnNumericData.kBoolean,
+    "double": OpenMaya.MFnNumericData.kDouble,
+    "long": OpenMaya.MFnNumericData.kInt,
+    "short": OpenMaya.MFnNumericData.kShort,
+}
+
+
+def _build_from_specs(node, specs):
+    # type: (str, List[Dict[str, Any]]) -> None
+    """Create the attributes described by the given `cmds.addAttr` flags.
+
+    The compound attributes are built with all their children through the
+    API and added to the node at once, instead of calling `cmds.addAttr` for
+    each child.
+    """
+    children = collections.defaultdict(list)  # type: Dict[str, List[Any]]
+    for flags in specs:
+        if "parent" in flags:
+            children[flags["parent"]].append(flags)
+
+    def build(flags):
+        # type: (Dict[str, Any]) -> OpenMaya.MObject
+        name = flags["longName"]
+        if flags.get("attributeType") == "compound":
+            compound = OpenMaya.MFnCompoundAttribute()
+            obj = compound.create(name, name)
+            for child in children[name]:
+                compound.addChild(build(child))
+            return obj
+        numeric_type = NUMERIC_TYPES[flags.get("attributeType", "double")]
+        return OpenMaya.MFnNumericAttribute().create(name, name, numeric_type)
+
+    mfn = maya_tools.api.as_dg(node)
+    for flags in specs:
+        if "parent" in flags:
+            continue
+        if flags.get("attributeType") == "compound":
+            mfn.addAttribute(build(flags))
+        else:
+            cmds.addAttr(node, **flags)
+
+
+COPY_CASES = [
+    ("long", [{"longName": "test", "attributeType": "long"}]),
+    ("short", [{"longName": "test", "attributeType": "short"}]),
+    ("bool", [{"longName": "test", "attributeType": "bool"}]),
+    ("string", [{"longName": "test", "dataType": "string"}]),
+    ("matrix", [{"longName": "test", "attributeType": "matrix"}]),
+    (
+        "compound",
+        [
+            {
+                "longName": "test",
+                "attributeType": "compound",
+                "numberOfChildren": 3,
+            },
+            {"longName": "testA", "parent": "test"},
+            {"longName": "testB", "parent": "test"},
+            {
+                "longName": "testC",
+                "parent": "test",
+                "attributeType": "compound",
+                "numberOfChildren": 2,
+            },
+            {"longName": "testCA", "parent": "testC"},
+            {"longName": "testCB", "parent": "testC"},
+        ],
+    ),
+    (
+        "multi",
+        [{"longName": "test", "attributeType": "short", "multi": True}],
+    ),
+]  # type: List[Tuple[str, List[Dict[str, Any]]]]
+
+
+def test_copy_types(transforms, clear_attributes):
+    # type: (List[str], Callable[[str], None]) -> None
+    """Test to copy simple attribute types."""
+    src, dst = transforms
+
+    for case, attributes in COPY_CASES:
+        # Create the attributes.
+        _build_from_specs(src, attributes)
+
+        # Perform the copy.
+        maya_tools.attribute.copy(src, dst, values=True)
+
+        # Compare the attributes.
+        dst_attributes = set(cmds.listAttr(dst, userDefined=True) or [])
+        for flags in attributes:
+            assert flags["longName"] in dst_attributes, case
+
+        # The matrix values are only the defaults, skip their comparison.
+        names = [
+            x["longName"]
+            for x in attributes
+            if x.get("attributeType") not in {"compound", "matrix"}
+        ]
+        for src_plug, dst_plug in zip(
+            ["{}.{}".format(src, x) for x in names],
+            ["{}.{}".format(dst, x) for x in names],
+        ):
+            assert cmds.getAttr(src_plug) == cmds.getAttr(dst_plug), case
+
+        # Start the next case from nodes without user-defined attributes.
+        clear_attributes(src)
+        clear_attributes(dst)
+
+
+def test_copy_existing(transforms):
+    # type: (List[str]) -> None
+    """Test to copy an attribute that already exists on the destination."""
+    src, dst = transforms
+
+    cmds.addAttr(src, longName="test")
+    cmds.addAttr(dst, longName="test")
+
+    maya_tools.attribute.copy(src, dst)
+
+    with pytest.raises(AttributeError):
+        maya_tools.attribute.copy(src, dst, fatal=True)
+
+
+def test_add_separator():
+    # type: () -> None
+    """Test to create separator attributes."""
+    node = cmds.createNode("transform", name="test")
+
+    plug = maya_tools.attribute.add_separator(node)
+    assert plug == "test.separator00"
+    plug = maya_tools.attribute.add_separator(node)
+    assert plug == "test.separator01"
+
+    plug = maya_tools.attribute.add_separator(node, name="divider{index}")
+    assert plug == "test.divider0"
+    plug = maya_tools.attribute.add_separator(node, name="divider{index}")
+    assert plug == "test.divider1"
+
+    with pytest.raises(ValueError):
+        maya_tools.attribute.add_separator(node, name="divider")
+
+
+@pytest.mark.parametrize(
+    "attributes",
+    [None, ["worldMatrix[0]"]],
+    ids=["locked", "multi"],
+)
+def test_invalid_reset(attributes):
+    # type: (Any) -> None
+    """Test invalid case of the reset function."""
+    node = cmds.createNode("transform")
+    plug = maya_tools.api.as_dg(node).findPlug("translateX", False)
+    plug.isLocked = True
+    maya_tools.attribute.reset(node, attributes=attributes)
+
+
+def _assert_order(node, expected):
+    # type: (str, List[str]) -> None
+    """Compare the order of the user-defined attributes in a single query."""
+    assert cmds.listAttr(node, userDefined=True) == expected
+
+
+@contextlib.contextmanager
+def _frozen_ui():
+    # type: () -> Generator[None, None, None]
+    """Suspend the refresh and the evaluation manager during the block."""
+    mode = cmds.evaluationManager(query=True, mode=True)[0]
+    cmds.refresh(suspend=True)
+    cmds.evaluationManager(mode="off")
+    try:
+        yield
+    finally:
+        cmds.evaluationManager(mode=mode)
+        cmds.refresh(suspend=False)
+
+
+@pytest.mark.usefixtures("undo", "new_file")
+def test_move_attribute():
+    # type: () -> None
+    """Test to move an attribute aloung the channel box."""
+    with _frozen_ui():
+        node = cmds.createNode("transform")
+        with maya_tools.history.undo():
+            for name in "ABCDE":
+                cmds.addAttr(node, longName=name)
+
+        # Valid case.
+        maya_tools.attribute.move(node + ".A", where="bottom")
+        _assert_order(node, ["B", "C", "D", "E", "A"])
+        maya_tools.attribute.move(node + ".E", where="top")
+        _assert_order(node, ["E", "B", "C", "D", "A"])
+        maya_tools.attribute.move(node + ".C", where="up")
+        _assert_order(node, ["E", "C", "B", "D", "A"])
+        maya_tools.attribute.move(node + ".B", where="down")
+        _assert_order(node, ["E", "C", "D", "B", "A"])
+
+        # Invalid case.
+        maya_tools.attribute.move(node + ".E", where="top")
+        _assert_order(node, ["E", "C", "D", "B", "A"])
+        maya_tools.attribute.move(node + ".E", where="up")
+        _assert_order(node, ["E", "C", "D", "B", "A"])
+        maya_tools.attribute.move(node + ".A", where="down")
+        _assert_order(node, ["E", "C", "D", "B", "A"])
+        maya_tools.attribute.move(node + ".A", where="bottom")
+        _assert_order(node, ["E", "C", "D", "B", "A"])
+
+        with pytest.raises(ValueError):
+            maya_tools.attribute.move(node + ".A", where="invalid")
+        maya_tools.attribute.move(node + ".translateX", where="up")
@@ -0,0 +1,22 @@
+"""Test maya hierarchy."""
+from maya import cmds
+
+import maya_tools.hierarchy
+
+
+def test_make_with_existing_parent():
+    # type: () -> None
+    """Test the make function with an existing parent mode."""
+    path = "a|b|c"
+    maya_tools.hierarchy.make(path)
+
+    path = "a|b|d"
+    assert maya_tools.hierarchy.make(path) == "d"
+    assert cmds.listRelatives("d", parent=True) == ["b"]
+    assert cmds.listRelatives("b", parent=True) == ["a"]
+    assert cmds.ls("a") == ["a"]
+    assert cmds.ls("b") == ["b"]
+
+    # The whole path already exists.
+    assert maya_tools.hierarchy.make(path) == "d"
+    assert cmds.ls("d") == ["d"]
@@ -0,0 +1,51 @@
+"""Test joint module."""
+from typing import Tuple
+
+import pytest
+
+from maya import cmds
+
+import maya_tools.joint
+
+
+def _create_joints():
+    # type: () -> Tuple[str, str]
+    """Create a child joint and a scaled target joint."""
+    child = cmds.createNode("joint", name="A")
+    target = cmds.createNode("joint", name="B")
+    cmds.setAttr(child + ".translate", 1, 2, 3)
+    cmds.setAttr(child + ".jointOrient", 10, 20, 30)
+    cmds.setAttr(target + ".translate", 3, 2, 1)
+    cmds.setAttr(target + ".scale", 1, 1.1, 1)
+    return child, target
+
+
+def test_parent():
+    # type: () -> None
+    """Test to parent a joint while preserving its position."""
+    child, target = _create_joints()
+    matrix = cmds.xform(child, query=True, matrix=True, worldSpace=True)
+
+    maya_tools.joint.parent(child, target)
+
+    assert cmds.listRelatives(child, parent=True) == [target]
+    assert cmds.listConnections(
+        child + ".inverseScale", source=True, destination=False
+    ) == [target]
+    result = cmds.xform(child, query=True, matrix=True, worldSpace=True)
+    assert result == pytest.approx(matrix, abs=1e-6)
+
+
+@pytest.mark.usefixtures("undo")
+def test_parent_undo():
+    # type: () -> None
+    """Test to revert the parenting of a joint with a single undo."""
+    child, target = _create_joints()
+
+    maya_tools.joint.parent(child, target)
+    cmds.undo()
+
+    assert cmds.listRelatives(child, parent=True) is None
+    assert not cmds.listConnections(child + ".inverseScale")
+    orient = cmds.getAttr(child + ".jointOrient")[0]
+    assert orient == pytest.approx((10, 20, 30))
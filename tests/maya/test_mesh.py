@@ -0,0 +1,26 @@
+"""Test mesh module."""
+import pytest
+
+from maya import cmds
+
+import maya_tools.mesh
+
+
+def test_closest_vertex():
+    # type: () -> None
+    """Test to find the closest vertex to a position."""
+    mesh = cmds.polyCube(constructionHistory=False)[0]
+    index, distance = maya_tools.mesh.closest_vertex(mesh, (0.5, 2, 0.5))
+    assert index == 3
+    assert distance == pytest.approx(1.5)
+
+
+def test_closest_vertices():
+    # type: () -> None
+    """Test to find the closest vertex to multiple positions at once."""
+    mesh = cmds.polyCube(constructionHistory=False)[0]
+    cmds.setAttr(mesh + ".translateX", 10)
+    origins = [(10.5, 2, 0.5), (9.5, -2, -0.5), (10.5, 0.5, 2)]
+    result = maya_tools.mesh.closest_vertices(mesh, origins)
+    assert [x[0] for x in result] == [3, 6, 3]
+    assert [x[1] for x in result] == pytest.approx([1.5, 1.5, 1.5])
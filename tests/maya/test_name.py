@@ -2,16 +2,21 @@
 import pytest
 
 from maya import cmds
+from maya.api import OpenMaya
 
+import maya_tools.api
 import maya_tools.name
 
 
 def create_conflicts():
     # type: () -> None
     """Create a scene with conflict names."""
-    cmds.createNode("transform", name="A")
-    cmds.createNode("transform", name="B")
-    cmds.createNode("transform", name="B", parent="A")
+    dag = OpenMaya.MDagModifier()
+    parent = dag.createNode("transform")
+    dag.renameNode(parent, "A")
+    dag.renameNode(dag.createNode("transform"), "B")
+    dag.renameNode(dag.createNode("transform", parent), "B")
+    dag.doIt()
 
 
 def test_confclit_names():
@@ -37,25 +42,11 @@ def test_conflict_names_set_deletion():
     """Ensure the set deletion if no confclit names is found."""
     create_conflicts()
     maya_tools.name.find_conflicts(create_set=True)
+    obj = maya_tools.api.as_object("CONFLICTS_NODES")
+    handle = OpenMaya.MObjectHandle(obj)
     cmds.delete("A|B")
     maya_tools.name.find_conflicts(create_set=True)
-    assert not cmds.objExists("CONFLICTS_NODES")
-
-
-@pytest.mark.parametrize(
-    "value,expected",
-    [
-        ("nice-name", "Nice Name"),
-        ("nice_name", "Nice Name"),
-        ("niceName", "Nice Name"),
-        ("NiceName", "Nice Name"),
-        ("nice name", "Nice Name"),
-    ],
-)
-def test_nice_name_generation(value, expected):
-    # type: (str, str) -> None
-    """Make sure the generated names are unique across the scene."""
-    assert maya_tools.name.nice(value) == expected
+    assert not handle.isValid()
 
 
 def test_generator_unique_name():
@@ -0,0 +1,38 @@
+"""Test performance module."""
+import sys
+from typing import Any
+
+import pytest
+
+from maya import cmds
+
+import maya_tools.performance
+
+
+@pytest.mark.usefixtures("new_file")
+def test_fps():
+    # type: () -> None
+    """Test to measure the playback speed of the current scene."""
+    cmds.playbackOptions(minTime=1, maxTime=5)
+    state = cmds.evaluator(name="cache", query=True, enable=True)
+
+    assert maya_tools.performance.fps(loops=2, cache=not state) > 0
+    assert cmds.evaluator(name="cache", query=True, enable=True) == state
+
+    with pytest.raises(ValueError):
+        maya_tools.performance.fps(loops=0)
+
+
+@pytest.mark.skipif(sys.version_info < (3,), reason="requires spawn")
+@pytest.mark.usefixtures("new_file")
+def test_batch_fps(tmp_path):
+    # type: (Any) -> None
+    """Test to measure the playback speed of saved scenes in parallel."""
+    cmds.playbackOptions(minTime=1, maxTime=3)
+    paths = [str(tmp_path / (x + ".ma")) for x in ("a", "b")]
+    for path in paths:
+        cmds.file(path, exportAll=True, type="mayaAscii", force=True)
+
+    result = maya_tools.performance.batch_fps(paths, processes=2)
+    assert sorted(result) == sorted(paths)
+    assert all(x > 0 for x in result.values())
@@ -0,0 +1,47 @@
+"""Test skincluster module."""
+from typing import Any
+
+from maya import cmds
+
+import maya_tools.skincluster
+
+
+def test_create_on_replaced_mesh():
+    # type: () -> None
+    """Ensure a new mesh re-using a cached name gets its own skincluster."""
+    joints = [cmds.createNode("joint") for _ in range(2)]
+    old = cmds.polyCube(name="cube", constructionHistory=False)[0]
+    old_skincluster = maya_tools.skincluster.create(old, joints)
+    cmds.rename(old, "old")
+
+    new = cmds.polyCube(name="cube", constructionHistory=False)[0]
+    new_skincluster = maya_tools.skincluster.create(new, joints)
+
+    assert new_skincluster != old_skincluster
+    geometry = cmds.skinCluster(new_skincluster, query=True, geometry=True)
+    assert cmds.listRelatives(new, shapes=True) == geometry
+
+
+def test_create_on_referenced_copies(tmp_path):
+    # type: (Any) -> None
+    """Ensure each copy of a file referenced twice uses its own skincluster."""
+    joints = [cmds.createNode("joint") for _ in range(2)]
+    mesh = cmds.polyCube(name="body", constructionHistory=False)[0]
+    maya_tools.skincluster.create(mesh, joints)
+    path = str(tmp_path / "character.ma")
+    cmds.file(path, exportAll=True, type="mayaAscii", force=True)
+
+    references = [
+        cmds.file(path, reference=True, namespace=x)
+        for x in ("charA", "charB")
+    ]
+    try:
+        for namespace in ("charA", "charB"):
+            influences = cmds.ls(namespace + ":*", type="joint")
+            skincluster = maya_tools.skincluster.create(
+                namespace + ":body", influences
+            )
+            assert skincluster == namespace + ":body_skinCluster"
+    finally:
+        for reference in references:
+            cmds.file(reference, removeReference=True)
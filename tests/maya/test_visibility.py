@@ -0,0 +1,37 @@
+"""Test visibility module."""
+import pytest
+
+from maya import cmds
+
+import maya_tools.visibility
+
+
+def test_is_visible():
+    # type: () -> None
+    """Test the visibility of a node through its ancestors."""
+    root = cmds.createNode("transform", name="A")
+    parent = cmds.createNode("transform", name="B", parent=root)
+    node = cmds.createNode("transform", name="C", parent=parent)
+    assert maya_tools.visibility.is_visible(node)
+
+    cmds.setAttr(root + ".visibility", False)
+    assert not maya_tools.visibility.is_visible(node)
+    assert not maya_tools.visibility.is_visible(root)
+
+    cmds.setAttr(root + ".visibility", True)
+    cmds.setAttr(node + ".visibility", False)
+    assert not maya_tools.visibility.is_visible(node)
+    assert maya_tools.visibility.is_visible(parent)
+
+
+def test_is_visible_dependency_node():
+    # type: () -> None
+    """Test the visibility of a node outside of the dag."""
+    assert maya_tools.visibility.is_visible("time1")
+
+
+def test_is_visible_missing_node():
+    # type: () -> None
+    """Test the visibility of a node that doesn't exist."""
+    with pytest.raises(IndexError):
+        maya_tools.visibility.is_visible("missing")
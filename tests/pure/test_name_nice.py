@@ -0,0 +1,20 @@
+"""Test the name functions that do not need a scene."""
+import pytest
+
+import maya_tools.name
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("nice-name", "Nice Name"),
+        ("nice_name", "Nice Name"),
+        ("niceName", "Nice Name"),
+        ("NiceName", "Nice Name"),
+        ("nice name", "Nice Name"),
+    ],
+)
+def test_nice_name_generation(value, expected):
+    # type: (str, str) -> None
+    """Make sure the generated names are unique across the scene."""
+    assert maya_tools.name.nice(value) == expected
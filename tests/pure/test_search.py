@@ -0,0 +1,46 @@
+# pylint: disable=protected-access
+"""Test the search functions that do not need a scene."""
+import pytest
+
+import maya_tools.search
+
+
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        (r".+Shape$", "*Shape"),
+        (r"ns:bar$", "*bar"),
+        (r"foo\.bar$", "*bar"),
+        (r"foo\x41$", None),
+        (r"foo\101$", None),
+        (r"foo\dbar$", None),
+        (r"foo\$", None),
+        (r"foo\Z", None),
+        (r"foo", None),
+        (r"(?i)foo$", None),
+        (r"(?x) fo o $", None),
+        (r"foo(?i:bar)$", None),
+        (r"foo$|bar$", None),
+        (r"(foo|bar)$", None),
+    ],
+    ids=[
+        "suffix",
+        "namespace",
+        "escaped-dot",
+        "hex-escape",
+        "octal-escape",
+        "class-escape",
+        "escaped-dollar",
+        "end-of-string",
+        "unanchored",
+        "ignore-case",
+        "verbose",
+        "local-flag",
+        "alternation",
+        "group",
+    ],
+)
+def test_glob(expression, expected):
+    # type: (str, str) -> None
+    """Test the maya pattern built to prefilter the regex search."""
+    assert maya_tools.search._glob(expression) == expected